@@ -0,0 +1,44 @@
+"""Index message status + created_at
+
+Revision ID: 4e9ab17d50fa
+Revises: d07a5b3f62c1
+Create Date: 2026-08-31 11:02:19.873112
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4e9ab17d50fa"
+down_revision: Union[str, None] = "d07a5b3f62c1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # SQLite has no column type alteration outside a table rebuild, and its
+    # TEXT affinity makes the narrowing cosmetic there anyway; guard like the
+    # content-to-JSON migration.
+    if op.get_bind().dialect.name != "sqlite":
+        op.alter_column(
+            "message",
+            "type",
+            type_=sqlmodel.sql.sqltypes.AutoString(length=32),
+            existing_type=sa.Text(),
+        )
+    op.create_index("ix_message_status_created_at", "message", ["status", "created_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_message_status_created_at", table_name="message")
+    if op.get_bind().dialect.name != "sqlite":
+        op.alter_column(
+            "message",
+            "type",
+            type_=sa.Text(),
+            existing_type=sqlmodel.sql.sqltypes.AutoString(length=32),
+        )
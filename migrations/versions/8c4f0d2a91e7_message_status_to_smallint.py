@@ -0,0 +1,63 @@
+"""Message status to smallint
+
+Revision ID: 8c4f0d2a91e7
+Revises: 3bb0633b746d
+Create Date: 2026-08-31 10:12:45.118204
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8c4f0d2a91e7"
+down_revision: Union[str, None] = "3bb0633b746d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Matches concrete.state.ProjectStatus
+STATUS_TO_INT = {
+    "init": 0,
+    "ready": 1,
+    "working": 2,
+    "waiting": 3,
+    "finished": 4,
+}
+
+
+def upgrade() -> None:
+    op.add_column("message", sa.Column("status_int", sa.SmallInteger(), nullable=True))
+    message = sa.table(
+        "message",
+        sa.column("status", sa.String()),
+        sa.column("status_int", sa.SmallInteger()),
+    )
+    connection = op.get_bind()
+    for label, value in STATUS_TO_INT.items():
+        connection.execute(message.update().where(message.c.status == label).values(status_int=value))
+    # Backfill anything the mapping missed (legacy/free-form labels) to INIT,
+    # or the SET NOT NULL below aborts with the old column already gone.
+    connection.execute(message.update().where(message.c.status_int.is_(None)).values(status_int=0))
+    # batch_alter_table: SQLite (the default DB_DRIVER in migrations/env.py)
+    # can't rename/alter columns outside a table rebuild.
+    with op.batch_alter_table("message") as batch_op:
+        batch_op.drop_column("status")
+        batch_op.alter_column("status_int", new_column_name="status", nullable=False, server_default="0")
+
+
+def downgrade() -> None:
+    op.add_column("message", sa.Column("status_str", sa.String(), nullable=True))
+    message = sa.table(
+        "message",
+        sa.column("status", sa.SmallInteger()),
+        sa.column("status_str", sa.String()),
+    )
+    connection = op.get_bind()
+    for label, value in STATUS_TO_INT.items():
+        connection.execute(message.update().where(message.c.status == value).values(status_str=label))
+    connection.execute(message.update().where(message.c.status_str.is_(None)).values(status_str="init"))
+    with op.batch_alter_table("message") as batch_op:
+        batch_op.drop_column("status")
+        batch_op.alter_column("status_str", new_column_name="status", nullable=False, server_default="init")
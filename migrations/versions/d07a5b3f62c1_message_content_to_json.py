@@ -0,0 +1,34 @@
+"""Message content to JSON
+
+Revision ID: d07a5b3f62c1
+Revises: 8c4f0d2a91e7
+Create Date: 2026-08-31 10:31:02.554317
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d07a5b3f62c1"
+down_revision: Union[str, None] = "8c4f0d2a91e7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # SQLite stores JSON as text, so only non-sqlite backends need a cast.
+    if op.get_bind().dialect.name != "sqlite":
+        op.alter_column(
+            "message",
+            "content",
+            type_=sa.JSON(),
+            postgresql_using="content::json",
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "sqlite":
+        op.alter_column("message", "content", type_=sa.Text())
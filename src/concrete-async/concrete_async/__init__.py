@@ -1,12 +1,34 @@
 from collections.abc import Callable
-from typing import Any, cast
 
 from celery.result import AsyncResult
+from concrete_async.models import KombuMixin, Operation
 from concrete_async.tasks import abstract_operation
 
 import concrete
 from concrete.clients import CLIClient, model_to_schema
-from concrete.models import KombuMixin, Message, Operation
+
+
+def _client_models(operator: "concrete.abstract.AbstractOperator") -> dict:
+    """
+    OpenAIClientModel snapshot of the operator's clients, cached per operator.
+
+    Rebuilding the pydantic models on every enqueue is pure producer-side CPU;
+    the clients dict rarely changes, so the cache is keyed on its identity and
+    a reassigned clients mapping rebuilds the snapshot.
+    """
+    source = operator.clients
+    cached = getattr(operator, "_client_models_cache", None)
+    if cached is not None and cached[0] is source:
+        return cached[1]
+    models = {
+        name: concrete.models.clients.OpenAIClientModel(
+            model=client.model,
+            temperature=client.default_temperature,
+        )
+        for name, client in source.items()
+    }
+    operator._client_models_cache = (source, models)
+    return models
 
 
 def _delay_factory(string_func: Callable[..., str]) -> Callable[..., AsyncResult]:
@@ -29,14 +51,7 @@ def _delay_factory(string_func: Callable[..., str]) -> Callable[..., AsyncResult
             arg_dict=arg_dict,
         )
 
-        clients = {}
-        for name, client in self.clients.items():
-            client_model = concrete.models.clients.OpenAIClientModel(
-                model=client.model,
-                temperature=client.default_temperature,
-            )
-
-            clients[name] = client_model
+        clients = _client_models(self)
 
         operation_result = abstract_operation.delay(operation=operation, clients=clients)
         return operation_result
@@ -44,6 +59,48 @@ def _delay_factory(string_func: Callable[..., str]) -> Callable[..., AsyncResult
     return _delay
 
 
+def delay_many(
+    operator: "concrete.abstract.AbstractOperator",
+    calls: list[tuple[str, tuple, dict]],
+) -> list[AsyncResult]:
+    """
+    Enqueue many delayed operator calls over a single broker connection.
+
+    calls is a list of (method_name, args, options) triples; options take the
+    same keys as the per-call options dict on wrapped methods, falling back to
+    the operator defaults. Publishing every operation through one producer
+    amortizes the connection acquire and socket round-trip that .delay pays
+    per task, and the client-models snapshot is serialized once per batch.
+    """
+    clients = _client_models(operator)
+    results = []
+    with abstract_operation.app.producer_pool.acquire(block=True) as producer:
+        for method_name, args, options in calls:
+            # Class-level access returns the raw prompt-producing function,
+            # bypassing the instance qna auto-wrap.
+            string_func = getattr(type(operator), method_name)
+            opts = operator._options | options
+            arg_dict = {
+                "messages": [
+                    {"role": "system", "content": opts["instructions"]},
+                    {"role": "user", "content": string_func(operator, *args)},
+                ],
+                "message_format": model_to_schema(opts["response_format"]),
+            }
+            operation = Operation(
+                client_name=operator.llm_client,
+                function_name=operator.llm_client_function,
+                arg_dict=arg_dict,
+            )
+            results.append(
+                abstract_operation.apply_async(
+                    kwargs={"operation": operation, "clients": clients},
+                    producer=producer,
+                )
+            )
+    return results
+
+
 for (
     operator_name,
     operator,
@@ -54,14 +111,8 @@ for (
         setattr(method, "_delay", _delay_factory(method))
 
 
-for message_name, message in concrete.models.messages.MESSAGE_REGISTRY.items():
-    new_class = type(
-        message.__name__,
-        (cast(type, KombuMixin), cast(Any, message)),
-        {"__module__": message.__module__},
-    )
-    setattr(concrete.models.messages, message.__name__, new_class)
-    concrete.models.messages.MESSAGE_REGISTRY[message_name] = cast(Message, new_class)
+# Messages need no per-class Kombu subclasses: models.py registers one
+# polymorphic serializer for the Message base class.
 
 original_model = concrete.models.clients.OpenAIClientModel
 
@@ -2,9 +2,11 @@
 broker_url = "pyamqp://localhost"
 result_backend = "rpc://localhost"
 
-task_serializer = "json"
-result_serializer = "json"
-accept_content = ["json"]
+# concrete-json is the orjson-backed serializer registered in models.py;
+# plain json stays accepted for messages produced by older workers.
+task_serializer = "concrete-json"
+result_serializer = "concrete-json"
+accept_content = ["json", "concrete-json"]
 
 task_default_queue = "concrete"
 
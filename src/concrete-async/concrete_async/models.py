@@ -1,6 +1,6 @@
-import json
-
-from kombu.utils.json import register_type
+import orjson
+from kombu.serialization import register
+from kombu.utils.json import _as, _encoders, loads, register_type
 from openai.types.chat import ChatCompletion
 from pydantic import BaseModel
 from pydantic.fields import Field
@@ -8,21 +8,71 @@ from pydantic.fields import Field
 import concrete
 
 
+def _encode(model: BaseModel) -> dict:
+    # Encode to a plain dict and let Kombu's JSON envelope do the single
+    # serialization pass; dumping to a JSON string here would be re-encoded
+    # (and re-parsed) a second time by Kombu.
+    return model.model_dump(mode="json")
+
+
 class KombuMixin(BaseModel):
     """
     Represents a Mixin to allow serialization and deserialization of subclasses
     """
 
     def __init_subclass__(cls, **kwargs):
-        register_type(
-            cls,
-            cls.__name__,
-            lambda model: model.model_dump_json(),
-            lambda model_json: cls.model_validate_json(model_json),
-        )
+        # One shared encoder and the class's own model_validate; per-class
+        # lambda closures would be allocated and retained forever in Kombu's
+        # registry. Registration itself must happen before any message is
+        # consumed, so it stays at class-creation time.
+        register_type(cls, cls.__name__, _encode, cls.model_validate)
         return super().__init_subclass__(**kwargs)
 
 
+def _poly_encode(message: "concrete.models.messages.Message") -> dict:
+    cls = type(message)
+    return {"__t": getattr(cls, "__registry_name__", cls.__name__), "d": message.model_dump(mode="json")}
+
+
+def _poly_decode(data: dict) -> "concrete.models.messages.Message":
+    # Payloads here were serialized by _poly_encode from validated models, so
+    # from_trusted can skip a second full validation pass.
+    return concrete.models.messages.Message.dereference(data["__t"]).from_trusted(data["d"])
+
+
+# One polymorphic registration covers every Message subclass — Kombu matches
+# encoders by isinstance — instead of one registry entry per leaf class.
+register_type(concrete.models.messages.Message, "ConcreteMessage", _poly_encode, _poly_decode)
+
+
+def _orjson_default(obj):
+    # Mirrors kombu's JSONEncoder.default so everything added through
+    # register_type keeps round-tripping when orjson does the encoding.
+    reducer = getattr(obj, "__json__", None)
+    if reducer is not None:
+        return reducer()
+    for t, (marker, encoder) in _encoders.items():
+        if isinstance(obj, t):
+            return encoder(obj) if marker is None else _as(marker, encoder(obj))
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _orjson_dumps(obj) -> bytes:
+    return orjson.dumps(obj, default=_orjson_default)
+
+
+# orjson encodes task payloads in Rust; decoding stays on kombu's loads since
+# the {"__type__": ...} envelope needs its object_hook. Selected via
+# task_serializer/accept_content in celeryconfig.
+register(
+    "concrete-json",
+    _orjson_dumps,
+    loads,
+    content_type="application/x-concrete-json",
+    content_encoding="utf-8",
+)
+
+
 class Operation(concrete.models.base.ConcreteModel, KombuMixin):
     client_name: str
     function_name: str
@@ -37,4 +87,4 @@ class ConcreteChatCompletion(ChatCompletion, concrete.models.base.ConcreteModel,
         message_format: type[concrete.models.messages.Message] = concrete.models.messages.Message.dereference(
             self.message_format_name
         )
-        return message_format.model_validate(json.loads(self.choices[0].message.content or "{}"))
+        return message_format.adapter().validate_json(self.choices[0].message.content or "{}")
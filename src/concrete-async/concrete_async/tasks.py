@@ -1,17 +1,32 @@
 from typing import Any, Callable, cast
 
-import concrete
-
 from .celery import app
 from .models import ConcreteChatCompletion, KombuMixin, Operation
 
+# Clients reused across task invocations, keyed by (name, model, temperature).
+# Constructing an OpenAIClient per task rebuilds its httpx connection pool,
+# forcing a fresh TCP/TLS handshake on the next request; a worker that keeps
+# one client per configuration reuses warm connections instead.
+_client_pool: dict[tuple, Any] = {}
+
 
 @app.task(name="concrete_async.tasks.abstract_operation")
 def abstract_operation(operation: Operation, clients: dict[str, KombuMixin]) -> Any:
     """
     An operation that's able to execute arbitrary methods on operators/agents
     """
-    client = concrete.clients.OpenAIClient(**clients[operation.client_name].model_dump())
+    client_model = clients[operation.client_name]
+    key = (operation.client_name, client_model.model, client_model.temperature)
+    if (client := _client_pool.get(key)) is None:
+        # Deferred like the core imports (see AbstractOperator.__init__), and
+        # imported from the submodule: the clients package itself doesn't
+        # re-export OpenAIClient.
+        from concrete.clients.openai import OpenAIClient
+
+        client = _client_pool[key] = OpenAIClient(
+            model=client_model.model,
+            temperature=client_model.temperature,
+        )
     func: Callable[..., Any] = getattr(client, operation.function_name)
 
     res = func(**operation.arg_dict).model_dump()
@@ -1,21 +1,170 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import time
 from abc import abstractmethod
 from collections.abc import Callable
-from functools import wraps
-from inspect import isclass
-from typing import Any, cast
+from functools import lru_cache, wraps
+from hashlib import blake2b
+from inspect import isclass, iscoroutinefunction
+from typing import TYPE_CHECKING, Any, cast
 from uuid import UUID, uuid4
 
 from concrete.clients import CLIClient
-from concrete.clients.openai import OpenAIClient
 from concrete.models.messages import Message, TextMessage, Tool
 from concrete.telemetry import add_tracing
-from concrete.tools import MetaTool
 from concrete.tools.utils import invoke_tool
 
+if TYPE_CHECKING:
+    # Annotation-only: the openai/tiktoken import chain is deferred to first
+    # client construction so cold starts that never hit an LM skip it.
+    from concrete.clients.openai import OpenAIClient
+    from concrete.tools import MetaTool
+
+
+# Shared empty containers for the decorated-call fast path; both are treated
+# as read-only, so reusing them avoids one allocation per qna call that
+# passes no options/tools.
+_EMPTY_OPTIONS: dict[str, Any] = {}
+_NO_TOOLS: tuple = ()
+
+# Static preface inserted before tool descriptions in a query. Module-level so
+# every qna call shares one string object instead of re-creating the literal.
+TOOLS_PREFACE = """Here are your available tools. If invoking a tool will help you answer the question, fill in the exact values for tool_name, tool_method, and tool_parameters. Leave these fields empty if no tool is needed."""  # noqa
+
+
+def _tools_suffix(operator, tools) -> str:
+    """
+    Tool preface + formatted tool descriptions, cached on the operator.
+
+    An operator's tool list rarely changes between qna calls, so re-rendering
+    every str(tool) per call is redundant. The cache is keyed on the list's
+    identity: passing explicit per-call tools or reassigning operator.tools
+    rebuilds the suffix.
+    """
+    cached = getattr(operator, "_tool_suffix_cache", None)
+    if cached is not None and cached[0] is tools:
+        return cached[1]
+    suffix = "".join([TOOLS_PREFACE, *map(str, tools)])
+    operator._tool_suffix_cache = (tools, suffix)
+    return suffix
+
+
+def _cache_key(
+    instructions: str | None,
+    query: str,
+    response_format: type,
+    model: str | None = None,
+    max_tokens: int | None = None,
+) -> bytes:
+    # model/max_tokens change the answer, so routed calls must not share
+    # cache entries with default-routed ones.
+    return blake2b(
+        f"{instructions}\x00{query}\x00{response_format.__qualname__}\x00{model}\x00{max_tokens}".encode(),
+        digest_size=16,
+    ).digest()
+
+
+def _cosine(a: list[float], b: list[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b))
+    norm_a = math.sqrt(sum(x * x for x in a))
+    norm_b = math.sqrt(sum(x * x for x in b))
+    return dot / (norm_a * norm_b) if norm_a and norm_b else 0.0
+
+
+def _aqna_wrapper(operator, question_producer: Callable) -> Callable:
+    """
+    Async twin of qna's _send_and_await_reply, for coroutine producers.
+
+    Module-level (not a method) so access to it never passes through the
+    operator's __getattribute__ auto-wrapping.
+    """
+
+    @wraps(question_producer)
+    async def _asend_and_await_reply(*args, **kwargs):
+        options: dict = kwargs.pop("options", None) or _EMPTY_OPTIONS
+
+        tools = options.get("tools") or (operator.tools if options.get("use_tools") else _NO_TOOLS)
+        response_format = options.get("response_format") or operator.response_format
+        instructions = options.get("instructions") or operator.instructions
+        # Forwarded only when set; see the matching note in qna's sync wrapper.
+        route: dict = {}
+        if (model := options.get("model")) is not None:
+            route["model"] = model
+        if (max_tokens := options.get("max_tokens")) is not None:
+            route["max_tokens"] = max_tokens
+
+        query = await question_producer(*args, **kwargs)
+        if not isinstance(query, str):
+            # Mirror the sync wrapper: non-string results are plain values,
+            # not prompts for the LM.
+            return query
+        if tools:
+            query += _tools_suffix(operator, tools)
+            response_format = type(
+                f"{response_format.__name__}WithTools",
+                (response_format, Tool),
+                {},
+            )
+
+        answer = await operator._aqna(
+            query,
+            response_format=response_format,
+            instructions=instructions,
+            **route,
+        )
+
+        retry_ct = 0  # try thrice
+        while retry_ct < 3:
+            try:
+                if issubclass(type(answer), Tool) and answer.tool_name and answer.tool_method:
+                    resp = invoke_tool(cast(Tool, answer))
+                    if resp is not None and hasattr(resp, "__str__"):
+                        query = (
+                            f"You called the tool: {answer.tool_name}.{answer.tool_method}\n"
+                            f"with the following parameters: {answer.tool_parameters}\n"
+                            f"The tool returned: {str(resp)}\n"
+                            "Use these results to answer the following query:\n"
+                            f"{await question_producer(*args, **kwargs)}"
+                        )
+                        answer = await operator._aqna(
+                            query,
+                            response_format=response_format,
+                            instructions=instructions,
+                            **route,
+                        )
+                break
+            except AttributeError:
+                retry_ct += 1
+        if retry_ct == 3:
+            CLIClient.emit("Could not invoke tool, returning attempted tool call request")
+        return answer
+
+    return _asend_and_await_reply
+
+
+@lru_cache(maxsize=128)
+def _system_message(instructions: str | None) -> dict[str, str | None]:
+    """
+    Shared system-message dict per instructions string.
+
+    Operator instructions are class-level constants, so every _qna call with
+    the same operator reuses one dict instead of allocating a fresh one per
+    LLM call. Bounded: instructions can also arrive per-call via options, and
+    an unbounded cache would pin every variant (plus the strings themselves)
+    for the process lifetime. Callers must treat the returned dict as
+    read-only.
+    """
+    return {"role": "system", "content": instructions}
+
 
 class AbstractOperatorMetaclass(type):
     OperatorRegistry: dict[str, Any] = {}
 
+    # Names the qna auto-wrap machinery must never intercept.
+    _unwrapped_names = frozenset({"qna", "_qna", "_aqna", "_qna_stream", "qna_batch"})
+
     def __new__(
         cls,
         clsname,
@@ -24,6 +173,23 @@ class AbstractOperatorMetaclass(type):
     ):
         new_class = super().__new__(cls, clsname, bases, classdict)
 
+        # Collect the prompt-producing method names once per class so
+        # __getattribute__ can decide wrap-vs-passthrough with a single
+        # frozenset lookup instead of a branch cascade on every attribute
+        # access. Inherited methods come in through the bases' sets.
+        wrappable: set[str] = set()
+        for base in bases:
+            wrappable |= getattr(base, "_wrappable_methods", frozenset())
+        for attr_name, attr_value in classdict.items():
+            if attr_name.startswith("__") or attr_name in cls._unwrapped_names:
+                continue
+            if callable(attr_value) and not isclass(attr_value):
+                wrappable.add(attr_name)
+            else:
+                # A subclass may shadow an inherited method with a non-callable.
+                wrappable.discard(attr_name)
+        new_class._wrappable_methods = frozenset(wrappable)
+
         AbstractOperatorMetaclass.OperatorRegistry.update({clsname: new_class})
 
         return new_class
@@ -44,11 +210,23 @@ class AbstractOperator(metaclass=AbstractOperatorMetaclass):
         response_format: type[Message] = TextMessage,
         run_async: bool = False,
         use_tools: bool = False,
+        cache: bool = False,
+        semantic_cache_threshold: float | None = None,
     ):
         """
         store_messages (bool): Whether or not to save the messages in db
+        cache (bool): Reuse answers for exactly repeated (instructions, query,
+            response_format) triples instead of re-asking the LM. Only enable
+            on deterministic prompts.
+        semantic_cache_threshold (float | None): When set (e.g. 0.95) and
+            cache is enabled, near-identical queries — by embedding cosine
+            similarity — also reuse cached answers.
         """
-        self._clients = clients or {"openai": OpenAIClient()}
+        if not clients:
+            from concrete.clients.openai import OpenAIClient
+
+            clients = {"openai": OpenAIClient()}
+        self._clients = clients
         self.llm_client = "openai"
         self.llm_client_function = "complete"
         self.tools = tools
@@ -59,6 +237,11 @@ class AbstractOperator(metaclass=AbstractOperatorMetaclass):
         self.starting_prompt = starting_prompt
         self.store_messages = store_messages
         self.use_tools = use_tools
+        self.cache = cache
+        self.semantic_cache_threshold = semantic_cache_threshold
+        self._response_cache: dict[bytes, Message] = {}
+        # (embedding, instructions, response_format, answer) per cached query
+        self._semantic_cache: list[tuple[list[float], str | None, type[Message], Message]] = []
 
     @add_tracing
     def _qna(
@@ -66,13 +249,42 @@ class AbstractOperator(metaclass=AbstractOperatorMetaclass):
         query: str,
         response_format: type[Message],
         instructions: str | None = None,
+        model: str | None = None,
+        max_tokens: int | None = None,
     ) -> Message:
         """
         "Question and Answer", given a query, return an answer.
         Basically just a wrapper for OpenAI's chat completion API.
+
+        model/max_tokens route an individual call to a different (usually
+        cheaper) model or cap its output without touching the client default;
+        short-output calls like ask_question don't need the full budget.
         """
+        completion_kwargs: dict[str, Any] = {}
+        if model is not None:
+            completion_kwargs["model"] = model
+        if max_tokens is not None:
+            completion_kwargs["max_completion_tokens"] = max_tokens
+
+        cache_key = query_embedding = None
+        if self.cache:
+            cache_key = _cache_key(instructions, query, response_format, model, max_tokens)
+            if (cached := self._response_cache.get(cache_key)) is not None:
+                return cached
+            # The semantic tier doesn't record routing, so per-call routed
+            # queries stick to the exact tier.
+            if self.semantic_cache_threshold is not None and not completion_kwargs:
+                query_embedding = self.clients["openai"].embed(query)
+                for embedding, cached_instructions, cached_format, cached_answer in self._semantic_cache:
+                    if (
+                        cached_instructions == instructions
+                        and cached_format is response_format
+                        and _cosine(embedding, query_embedding) >= self.semantic_cache_threshold
+                    ):
+                        return cached_answer
+
         messages = [
-            {"role": "system", "content": instructions},
+            _system_message(instructions),
             {"role": "user", "content": query},
         ]
 
@@ -81,6 +293,13 @@ class AbstractOperator(metaclass=AbstractOperatorMetaclass):
             .complete(
                 messages=messages,
                 message_format=response_format,
+                # All instances of an operator class share the same static
+                # instruction/example prefix; a stable key per class pins
+                # provider-side prefix-cache routing across calls. Sent via
+                # extra_body because the pinned openai SDK predates the
+                # explicit prompt_cache_key parameter.
+                extra_body={"prompt_cache_key": type(self).__name__},
+                **completion_kwargs,
             )
             .choices[0]
             .message
@@ -100,14 +319,200 @@ class AbstractOperator(metaclass=AbstractOperatorMetaclass):
                     "Concrete database package `concrete-db` must be installed to store messages."
                 ) from e
 
+        if cache_key is not None:
+            self._response_cache[cache_key] = answer
+            if query_embedding is not None:
+                self._semantic_cache.append((query_embedding, instructions, response_format, answer))
+
         return answer
 
+    async def _aqna(
+        self,
+        query: str,
+        response_format: type[Message],
+        instructions: str | None = None,
+        model: str | None = None,
+        max_tokens: int | None = None,
+    ) -> Message:
+        """
+        Async counterpart of _qna. Awaiting callers overlap their network
+        round-trips (e.g. asyncio.gather over independent component prompts)
+        instead of serializing them thread-blocked.
+
+        Shares the exact-match response cache with _qna; the semantic tier is
+        sync-only since embed is a blocking call.
+        """
+        completion_kwargs: dict[str, Any] = {}
+        if model is not None:
+            completion_kwargs["model"] = model
+        if max_tokens is not None:
+            completion_kwargs["max_completion_tokens"] = max_tokens
+
+        cache_key = None
+        if self.cache:
+            cache_key = _cache_key(instructions, query, response_format, model, max_tokens)
+            if (cached := self._response_cache.get(cache_key)) is not None:
+                return cached
+
+        messages = [
+            _system_message(instructions),
+            {"role": "user", "content": query},
+        ]
+
+        completion = await self.clients["openai"].acomplete(
+            messages=messages,
+            message_format=response_format,
+            extra_body={"prompt_cache_key": type(self).__name__},
+            **completion_kwargs,
+        )
+        response = completion.choices[0].message
+
+        if response.refusal:
+            CLIClient.emit(f"Operator refused to answer question: {query}")
+            raise Exception("Operator refused to answer question")
+
+        answer = response.parsed
+
+        if self.store_messages:
+            try:
+                import concrete_db  # noqa
+            except ModuleNotFoundError as e:
+                raise ModuleNotFoundError(
+                    "Concrete database package `concrete-db` must be installed to store messages."
+                ) from e
+
+        if cache_key is not None:
+            self._response_cache[cache_key] = answer
+
+        return answer
+
+    async def _qna_stream(
+        self,
+        query: str,
+        response_format: type[Message],
+        instructions: str | None = None,
+        model: str | None = None,
+        max_tokens: int | None = None,
+    ):
+        """
+        Streamed _aqna: yields content deltas as they arrive, then the parsed
+        message as the final item. Consumers can render progress or bail out
+        mid-stream; validation runs once on the accumulated text.
+
+        model/max_tokens route the stream like _qna's counterparts.
+        """
+        completion_kwargs: dict[str, Any] = {}
+        if model is not None:
+            completion_kwargs["model"] = model
+        if max_tokens is not None:
+            completion_kwargs["max_completion_tokens"] = max_tokens
+
+        messages = [
+            _system_message(instructions),
+            {"role": "user", "content": query},
+        ]
+
+        parts: list[str] = []
+        async for delta in self.clients["openai"].acomplete_stream(
+            messages=messages,
+            message_format=response_format,
+            extra_body={"prompt_cache_key": type(self).__name__},
+            **completion_kwargs,
+        ):
+            parts.append(delta)
+            yield delta
+
+        yield response_format.adapter().validate_json("".join(parts) or "{}")
+
+    async def qna_batch(
+        self,
+        queries: list[str],
+        response_format: type[Message] | None = None,
+        instructions: str | None = None,
+        max_requests_per_minute: int = 500,
+        max_tokens_per_minute: int = 200_000,
+        max_attempts: int = 5,
+        max_concurrent: int = 16,
+    ) -> list[Message]:
+        """
+        Answer many independent queries concurrently while staying under
+        request- and token-per-minute budgets.
+
+        Capacity refills continuously at limit/60 per second; each submission
+        spends one request plus the query's estimated token cost, and rate
+        limit responses back off exponentially up to max_attempts. Results
+        come back in query order. max_concurrent bounds in-flight requests so
+        a burst of queries doesn't open hundreds of sockets at once even when
+        the per-minute budgets would allow it.
+        """
+        from openai import RateLimitError
+
+        response_format = response_format or self.response_format
+        instructions = instructions or self.instructions
+
+        try:
+            # Memoized per (model, text), so shared prompt prefixes and
+            # repeated queries only pay for BPE once.
+            estimates = [self.clients["openai"].token_count(query) for query in queries]
+        except Exception:
+            # encoding_for_model downloads encodings on first use; offline,
+            # fall back to the ~4 chars/token heuristic.
+            estimates = [len(query) // 4 + 1 for query in queries]
+        # An estimate above the per-minute budget could never acquire capacity
+        # and would poll forever; clamp it so the query waits out at most one
+        # full window (the API enforces the real limit).
+        estimates = [min(estimate, max_tokens_per_minute) for estimate in estimates]
+
+        request_capacity = float(max_requests_per_minute)
+        token_capacity = float(max_tokens_per_minute)
+        last_refill = time.monotonic()
+        capacity_lock = asyncio.Lock()
+        in_flight = asyncio.Semaphore(max_concurrent)
+
+        async def acquire(cost: int) -> None:
+            nonlocal request_capacity, token_capacity, last_refill
+            while True:
+                async with capacity_lock:
+                    now = time.monotonic()
+                    elapsed = now - last_refill
+                    last_refill = now
+                    request_capacity = min(
+                        float(max_requests_per_minute),
+                        request_capacity + elapsed * max_requests_per_minute / 60,
+                    )
+                    token_capacity = min(
+                        float(max_tokens_per_minute),
+                        token_capacity + elapsed * max_tokens_per_minute / 60,
+                    )
+                    if request_capacity >= 1 and token_capacity >= cost:
+                        request_capacity -= 1
+                        token_capacity -= cost
+                        return
+                await asyncio.sleep(0.1)
+
+        async def run_one(query: str, cost: int) -> Message:
+            for attempt in range(max_attempts):
+                await acquire(cost)
+                try:
+                    async with in_flight:
+                        return await self._aqna(query, response_format=response_format, instructions=instructions)
+                except RateLimitError:
+                    await asyncio.sleep(2**attempt)
+            raise Exception(f"Exhausted {max_attempts} attempts on rate-limited query")
+
+        return list(await asyncio.gather(*(run_one(query, cost) for query, cost in zip(queries, estimates))))
+
     def qna(self, question_producer: Callable[..., str]) -> Callable:
         """
         Decorate something on a child object downstream to get a response from a query
 
         question_producer is expected to return a request like "Create a website that does xyz"
+
+        Coroutine producers get an async wrapper driven by _aqna, so decorated
+        methods on async operators can be awaited and fanned out concurrently.
         """
+        if iscoroutinefunction(question_producer):
+            return _aqna_wrapper(self, question_producer)
 
         @wraps(question_producer)
         def _send_and_await_reply(
@@ -123,23 +528,27 @@ class AbstractOperator(metaclass=AbstractOperatorMetaclass):
                 # Clobbers the Operator instance attributes
                 instructions (str): override system prompt
                 tools (list[concrete.models.MetaTool]): list of tools available for the operator
+                model (str): route this call to a different model
+                max_tokens (int): cap completion tokens for this call
             """
-            options: dict = kwargs.pop("options", {}) | {}
+            options: dict = kwargs.pop("options", None) or _EMPTY_OPTIONS
 
-            tools = options.get("tools") or (self.tools if options.get("use_tools") else [])
+            tools = options.get("tools") or (self.tools if options.get("use_tools") else _NO_TOOLS)
             response_format = options.get("response_format") or self.response_format
             instructions = options.get("instructions") or self.instructions
-
-            tools_addendum = ""
-            if tools:
-                tools_addendum = """Here are your available tools. If invoking a tool will help you answer the question, fill in the exact values for tool_name, tool_method, and tool_parameters. Leave these fields empty if no tool is needed."""  # noqa
-
-                for tool in tools:
-                    tools_addendum += str(tool)
-
-            # Fetch underlying prompt, post string interpolation
+            # Forwarded only when set, so _qna overrides (tests, subclasses)
+            # with the historical signature keep working.
+            route: dict[str, Any] = {}
+            if (model := options.get("model")) is not None:
+                route["model"] = model
+            if (max_tokens := options.get("max_tokens")) is not None:
+                route["max_tokens"] = max_tokens
+
+            # Fetch underlying prompt, post string interpolation; the tool
+            # suffix arrives pre-joined from the per-operator cache.
             query = question_producer(*args, **kwargs)
-            query += tools_addendum
+            if tools:
+                query += _tools_suffix(self, tools)
 
             if tools:
                 response_format = type(
@@ -148,11 +557,17 @@ class AbstractOperator(metaclass=AbstractOperatorMetaclass):
                     {},
                 )
 
+            if options.get("stream"):
+                # Hand back the async delta iterator; the tool-invocation loop
+                # below does not apply mid-stream.
+                return self._qna_stream(query, response_format=response_format, instructions=instructions, **route)
+
             # Process the finalized query
             answer = self._qna(
                 query,
                 response_format=response_format,
                 instructions=instructions,
+                **route,
             )
 
             # TODO Reconsider where this occurs.
@@ -166,15 +581,18 @@ class AbstractOperator(metaclass=AbstractOperatorMetaclass):
                         resp = invoke_tool(cast(Tool, answer))
                         if resp is not None and hasattr(resp, "__str__"):
                             # Update the query to include the tool call results.
-                            tool_preface = f"You called the tool: {answer.tool_name}.{answer.tool_method}\n"
-                            tool_preface += f"with the following parameters: {answer.tool_parameters}\n"
-                            tool_preface += f"The tool returned: {str(resp)}\n"
-                            tool_preface += "Use these results to answer the following query:\n"
-                            query = tool_preface + question_producer(*args, **kwargs)
+                            query = (
+                                f"You called the tool: {answer.tool_name}.{answer.tool_method}\n"
+                                f"with the following parameters: {answer.tool_parameters}\n"
+                                f"The tool returned: {str(resp)}\n"
+                                "Use these results to answer the following query:\n"
+                                f"{question_producer(*args, **kwargs)}"
+                            )
                             answer = self._qna(
                                 query,
                                 response_format=response_format,
                                 instructions=instructions,
+                                **route,
                             )
                     break
                 except AttributeError:
@@ -201,19 +619,44 @@ class AbstractOperator(metaclass=AbstractOperatorMetaclass):
         """
         pass
 
-    # TODO: Do not re-build function every time on access but
-    # still allow properties to be overridden after instantiation
     def __getattribute__(self, name: str) -> Any:
+        # Everything but the class's known prompt-producing methods takes the
+        # plain lookup path; the set is precomputed by the metaclass.
+        if name not in type(self)._wrappable_methods:
+            return super().__getattribute__(name)
         attr = super().__getattribute__(name)
-        if name.startswith("__") or name in {"qna", "_qna"} or not callable(attr) or isclass(attr):
+        if not callable(attr):
+            # The name was shadowed on the instance with a non-callable.
             return attr
 
+        # One wrapper per attribute name, cached on the instance instead of
+        # rebuilt (a closure allocation) on every access. The entry is keyed
+        # by the underlying function's identity — bound-method objects differ
+        # per access — so reassigning the method after instantiation still
+        # rebuilds the wrapper.
+        instance_dict = super().__getattribute__("__dict__")
+        if (cache := instance_dict.get("_wrapped_cache")) is None:
+            cache = instance_dict["_wrapped_cache"] = {}
+        underlying = getattr(attr, "__func__", attr)
+        cached = cache.get(name)
+        if cached is not None and cached[0] is underlying:
+            return cached[1]
+
         def wrapped_func(*args, **kwargs):
+            # _options is a property that builds a fresh dict (and evaluates
+            # the instructions/response_format properties); compute it once
+            # per call instead of once per use.
             self_options = self._options
-            kwargs_options = kwargs.pop("options", {})
+            kwargs_options = kwargs.pop("options", None) or _EMPTY_OPTIONS
             options = self_options | kwargs_options
 
-            result = attr(*args, options=self._options, **kwargs)
+            if iscoroutinefunction(attr):
+                # A coroutine producer can't be probed for a str result
+                # without awaiting it; hand it straight to the async qna
+                # wrapper, whose coroutine resolves to the LLM answer.
+                return self.qna(attr)(*args, options=options, **kwargs)
+
+            result = attr(*args, options=self_options, **kwargs)
             if not isinstance(result, str):
                 return result
 
@@ -223,6 +666,7 @@ class AbstractOperator(metaclass=AbstractOperatorMetaclass):
 
             return llm_func(*args, options=options, **kwargs)
 
+        cache[name] = (underlying, wrapped_func)
         return wrapped_func
 
     @property
@@ -1,5 +1,6 @@
 import os
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Any, Sequence, TypeVar
 
 from pydantic import BaseModel as PydanticModel
@@ -34,9 +35,16 @@ class CLIClient(Client):
                 print(str(item))
 
 
+@lru_cache(maxsize=128)
 def model_to_schema(model: type[PydanticModel]) -> dict[str, str | dict]:
     """
     Utility for formatting a pydantic model into a json output for OpenAI.
+
+    Memoized per model class: model_json_schema walks the whole model tree,
+    and the same handful of response formats are converted on every enqueue
+    and streaming call. Bounded because tool-augmented calls synthesize
+    throwaway *WithTools classes that must not be pinned forever. Callers
+    must treat the returned dict as read-only.
     """
     return {
         "type": "json_schema",
@@ -1,22 +1,49 @@
 import os
 import re
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
-import tiktoken
-
 try:
-    from openai import OpenAI  # noqa
+    from openai import AsyncOpenAI, OpenAI  # noqa
     from tiktoken import encoding_for_model
 except ImportError as e:
     raise ImportError("Install extra openai to use OpenAIClient. (e.g. `pip install concrete-core[openai]`") from e
 
-from concrete.clients import CLIClient, LMClient
+from concrete.clients import CLIClient, LMClient, model_to_schema
 from concrete.models.messages import Message, TextMessage
 
 if TYPE_CHECKING:
     from openai.types.chat import ChatCompletion
 
 
+@lru_cache(maxsize=None)
+def _encoding(model: str):
+    # encoding_for_model resolves the model -> BPE mapping (and may fetch the
+    # encoding file) on every call; one instance per model is enough.
+    return encoding_for_model(model)
+
+
+# Texts longer than this are tokenized every time rather than memoized: the
+# cache holds its keys alive, and message_fits feeds whole joined prompts
+# through here, so caching long texts would pin megabytes of dead prompt
+# strings. Short texts (static prefixes, recurring queries) are the ones that
+# actually repeat.
+_TOKEN_COUNT_CACHE_MAX_CHARS = 8_192
+
+
+@lru_cache(maxsize=1024)
+def _cached_token_count(model: str, text: str) -> int:
+    return len(_encoding(model).encode(text))
+
+
+def _token_count(model: str, text: str) -> int:
+    # Memoized: agent loops re-tokenize the same static prompt prefixes and
+    # recurring contexts hundreds of times per session.
+    if len(text) > _TOKEN_COUNT_CACHE_MAX_CHARS:
+        return len(_encoding(model).encode(text))
+    return _cached_token_count(model, text)
+
+
 class OpenAIClient(LMClient):
     """
     Thin wrapper around open AI client.
@@ -25,17 +52,24 @@ class OpenAIClient(LMClient):
     def __init__(self, model: str | None = None, temperature: float | None = None):
         OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
         self.client = OpenAI(api_key=OPENAI_API_KEY)
+        # Shares one connection pool across all acomplete calls, so concurrent
+        # requests reuse TCP/TLS sessions instead of handshaking per call.
+        self.async_client = AsyncOpenAI(api_key=OPENAI_API_KEY)
         self.default_temperature = temperature if temperature is not None else float(os.getenv("OPENAI_TEMPERATURE", 0))
         self.model = model or "gpt-4o-mini"
 
+    def token_count(self, text: str) -> int:
+        """
+        Number of tokens text encodes to under this client's model, memoized
+        across calls (rate-limit budgeting re-counts the same prompts).
+        """
+        return _token_count(self.model, text)
+
     def message_fits(self, message: str) -> bool:
         """
         Check if the message fits in the model.
         No API for checking - so this is copied manually from https://platform.openai.com/docs/models/gp
         """
-        encoding = encoding_for_model(self.model)
-        num_tokens = len(encoding.encode(message))
-
         # Note: No support for -latest models.
         # Also, wtf? Why are the model names so inconsistent?
         gpt_4o_pattern = r"(^gpt-4o$)|(^gpt-4o-\d{4}-\d{2}-\d{2}$)"
@@ -64,8 +98,7 @@ class OpenAIClient(LMClient):
         elif re.search(gpt_3_5_turbo_pattern, self.model):
             context_window, max_output = 16_384, 4_096
 
-        encoding = tiktoken.encoding_for_model(self.model)
-        num_tokens = len(encoding.encode(message))
+        num_tokens = self.token_count(message)
         return (context_window - max_output) >= num_tokens
 
     def complete(
@@ -100,3 +133,75 @@ class OpenAIClient(LMClient):
         except RateLimitError as e:
             CLIClient.emit(f"Rate limit error: {e}")
             raise e  # retry decorator
+
+    async def acomplete_stream(
+        self,
+        messages: list[dict[str, str]],
+        message_format: type[Message] = TextMessage,
+        temperature: float | None = None,
+        **kwargs,
+    ):
+        """
+        Stream a completion, yielding content deltas as they arrive.
+
+        Lets callers display progress or cancel early instead of blocking for
+        the whole response; structured callers accumulate the deltas and
+        validate once at the end.
+        """
+        if not self.message_fits(' '.join([m['content'] for m in messages])):
+            raise ValueError("Message does not fit in model")
+
+        request_params = {
+            "messages": messages,
+            "model": self.model,
+            "temperature": (temperature if temperature is not None else self.default_temperature),
+            "stream": True,
+            **kwargs,
+        }
+        if isinstance(message_format, type(Message)):
+            # parse() cannot stream; pass the schema through json_schema mode
+            # and let the caller validate the accumulated text.
+            request_params["response_format"] = model_to_schema(message_format)
+
+        stream = await self.async_client.chat.completions.create(**request_params)
+        async for chunk in stream:
+            if chunk.choices and (delta := chunk.choices[0].delta.content):
+                yield delta
+
+    def embed(self, text: str, model: str = "text-embedding-3-small") -> list[float]:
+        """
+        Embedding vector for text; used by the operator-level semantic cache.
+        """
+        return self.client.embeddings.create(input=text, model=model).data[0].embedding
+
+    async def acomplete(
+        self,
+        messages: list[dict[str, str]],
+        message_format: type[Message] = TextMessage,
+        temperature: float | None = None,
+        **kwargs,
+    ) -> "ChatCompletion":
+        """
+        Async counterpart of complete. Awaiting callers can fan out many
+        independent requests concurrently; the network round-trips overlap
+        instead of serializing end-to-end.
+        """
+        if not self.message_fits(' '.join([m['content'] for m in messages])):
+            raise ValueError("Message does not fit in model")
+        from openai import RateLimitError
+
+        request_params = {
+            "messages": messages,
+            "model": self.model,
+            "temperature": (temperature if temperature is not None else self.default_temperature),
+            "response_format": message_format,
+            **kwargs,
+        }
+
+        try:
+            if isinstance(message_format, type(Message)):
+                return await self.async_client.beta.chat.completions.parse(**request_params)
+            return await self.async_client.chat.completions.create(**request_params)
+        except RateLimitError as e:
+            CLIClient.emit(f"Rate limit error: {e}")
+            raise e  # retry decorator
@@ -1,6 +1,9 @@
 # TODO: Replace PydanticModel with dataclass
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class ConcreteModel(BaseModel):
-    pass
+    # Frozen instances are immutable after validation, which lets pydantic
+    # skip per-field setter machinery and makes models hashable/cacheable;
+    # hot-path messages are allocated constantly and never mutated.
+    model_config = ConfigDict(frozen=True)
@@ -1,5 +1,3 @@
-import json
-
 from openai.types.chat import ChatCompletion
 from pydantic import Field
 
@@ -20,7 +18,9 @@ class ConcreteChatCompletion(ChatCompletion):
     @property
     def message(self) -> Message:
         message_format: type[Message] = Message.dereference(self.message_format_name)
-        return message_format.model_validate(json.loads(self.choices[0].message.content or "{}"))
+        # The compiled adapter parses straight into the model, skipping both
+        # the intermediate dict from json.loads and per-call validator lookup.
+        return message_format.adapter().validate_json(self.choices[0].message.content or "{}")
 
     @property
     def text(self) -> Message:
@@ -16,9 +16,13 @@ Example:
 
 import io
 import json
+import sys
 import zipfile
+from functools import lru_cache
+from inspect import isclass
+from typing import get_args, get_origin
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr, TypeAdapter
 
 from .base import ConcreteModel
 
@@ -27,36 +31,122 @@ from .base import ConcreteModel
 MESSAGE_REGISTRY: dict[str, "Message"] = {}
 
 
+def _trusted_value(annotation, value):
+    # Recurse into the nested-message shapes our fields actually use
+    # (Message and list[Message]); everything else passes through as-is.
+    if isclass(annotation) and issubclass(annotation, Message) and isinstance(value, dict):
+        return annotation.from_trusted(value)
+    if get_origin(annotation) is list and isinstance(value, list):
+        (item_type,) = get_args(annotation)
+        if isclass(item_type) and issubclass(item_type, Message):
+            return [item_type.from_trusted(item) if isinstance(item, dict) else item for item in value]
+    # tuple fields (PlannedComponents.components, Summary.summary) arrive as
+    # JSON lists; model_construct won't coerce them, so do it here.
+    if get_origin(annotation) is tuple and isinstance(value, list):
+        return tuple(value)
+    return value
+
+
 class Message(ConcreteModel):
     """
     Wrapper for OpenAI Structured Outputs
     """
 
+    # Serialized form, filled on first __str__/__repr__. Safe to memoize
+    # because ConcreteModel is frozen; private attrs stay settable on frozen
+    # models and are excluded from dumps.
+    _cached_str: str | None = PrivateAttr(default=None)
+
     @classmethod
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
         registry_name = getattr(cls, "__registry_name__", cls.__name__)
-        MESSAGE_REGISTRY[registry_name.lower()] = cls
+        # Interned keys share one string object per name, so hot lookups skip
+        # hash recomputation.
+        MESSAGE_REGISTRY[sys.intern(registry_name.casefold())] = cls
 
     @classmethod
+    def adapter(cls) -> TypeAdapter:
+        """
+        Compiled TypeAdapter for this message class, built on first use.
+
+        validate_json on the adapter enters pydantic-core directly, skipping
+        the per-call generic validator dispatch of model_validate_json.
+        """
+        # Checked via __dict__ so subclasses don't inherit a parent's adapter.
+        if (adapter := cls.__dict__.get("_adapter")) is None:
+            adapter = TypeAdapter(cls)
+            cls._adapter = adapter
+        return adapter
+
+    @classmethod
+    @lru_cache(maxsize=None)
     def dereference(cls, name: str):
         """
         Return the object class if it exists otherwise raise a ValueError.
+
+        Memoized: the set of message names is tiny and bounded. Anything that
+        mutates MESSAGE_REGISTRY after import (e.g. concrete-async swapping in
+        Kombu subclasses) must call Message.dereference.cache_clear().
         """
-        if not (message_type := MESSAGE_REGISTRY.get(name.lower())):
+        if not (message_type := MESSAGE_REGISTRY.get(sys.intern(name.casefold()))):
             raise ValueError(f"Unknown response type: {name}")
         return message_type
 
+    @classmethod
+    def from_trusted(cls, data: dict) -> "Message":
+        """
+        Rebuild a message from an already-validated payload without re-running
+        validation. Only for data this codebase serialized itself (Kombu
+        payloads, cache hits); never feed it external input.
+
+        model_construct skips pydantic-core validation, which scales with
+        payload size on nested models like ProjectDirectory.
+        """
+        kwargs = {
+            name: _trusted_value(field.annotation, data[name])
+            for name, field in cls.model_fields.items()
+            if name in data
+        }
+        return cls.model_construct(**kwargs)
+
+    def _dump_json(self) -> str:
+        # Single serialization shared by __str__ and __repr__, memoized on the
+        # (immutable) instance so repeated logging/formatting of one message is
+        # an attribute load instead of a fresh model walk.
+        # model_dump_json goes model -> JSON in one pass inside pydantic-core,
+        # skipping the intermediate dict a model_dump + dumps pair would build;
+        # exclude_defaults/exclude_none filter during that same pass. Output is
+        # ensure_ascii=False by default, so no post-hoc unescaping is needed.
+        if self._cached_str is None:
+            self._cached_str = self.model_dump_json(indent=2, exclude_defaults=True, exclude_none=True)
+        return self._cached_str
+
+    def write_to(self, fp) -> None:
+        """
+        Stream this message's JSON to a writable text file object.
+
+        For multi-megabyte payloads (a ProjectDirectory full of file_contents)
+        __str__ materializes one giant string before anything is written;
+        iterencode emits chunks as they are produced, keeping peak memory flat
+        and overlapping encoding with the consumer's I/O. Output matches
+        __str__.
+        """
+        encoder = json.JSONEncoder(ensure_ascii=False, indent=2)
+        dumped = self.model_dump(mode="json", exclude_defaults=True, exclude_none=True)
+        for chunk in encoder.iterencode(dumped):
+            fp.write(chunk)
+
     def __str__(self):
         """
         Required for message passing to LMs
         """
-        return json.dumps(self, default=lambda o: o.__dict__, sort_keys=True, indent=4)
+        return self._dump_json()
 
     def __repr__(self):
         # Consider moving this to db - don't need a __repr__ unless you're saving it to a db?
         # Consider whether
-        return json.dumps(self, default=lambda o: o.__dict__, sort_keys=True, indent=4)
+        return self._dump_json()
 
 
 class TextMessage(Message):
@@ -76,12 +166,15 @@ class Tool(Message):
     tool_parameters: list[Param] = Field(description="List of parameters for the tool")
 
 
+# tuple[str, ...] fields: these sequences are never mutated downstream, and on
+# frozen models a tuple lets pydantic skip the defensive list copy at
+# validation time while serializing to the same JSON array.
 class PlannedComponents(Message):
-    components: list[str] = Field(description="List of planned components")
+    components: tuple[str, ...] = Field(description="List of planned components")
 
 
 class Summary(Message):
-    summary: list[str] = Field(
+    summary: tuple[str, ...] = Field(
         description="A list of component summaries. Each list item represents an unbroken summary"
     )
 
@@ -111,6 +204,36 @@ class ProjectDirectory(Message):
         zip_buffer.seek(0)  # Reset buffer position for streaming
         return zip_buffer
 
+    def to_flat(self) -> "ProjectDirectoryFlat":
+        return ProjectDirectoryFlat(
+            project_name=self.project_name,
+            file_names=[f.file_name for f in self.files],
+            file_contents=[f.file_contents for f in self.files],
+        )
+
+
+class ProjectDirectoryFlat(Message):
+    """
+    Structure-of-arrays form of ProjectDirectory.
+
+    Two parallel string lists serialize with one contiguous pass each, instead
+    of walking one ProjectFile object per file; prefer this form for bulk JSON
+    emit (prompts, Kombu payloads).
+    """
+
+    project_name: str = Field(description="Name of the project directory")
+    file_names: list[str] = Field(description="File paths relative to root, parallel to file_contents")
+    file_contents: list[str] = Field(description="File contents, parallel to file_names")
+
+    def to_directory(self) -> ProjectDirectory:
+        return ProjectDirectory(
+            project_name=self.project_name,
+            files=[
+                ProjectFile(file_name=name, file_contents=contents)
+                for name, contents in zip(self.file_names, self.file_contents)
+            ],
+        )
+
 
 class ChildNodeSummary(Message):
     node_name: str = Field(description="Name of the node")
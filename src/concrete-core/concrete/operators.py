@@ -3,6 +3,116 @@ from typing import Any
 
 from .abstract import AbstractOperator
 
+# Templates are dedented once at import; dedent() would rescan the whole
+# string on every call. Static instruction/example blocks come first and the
+# dynamic payload is appended last so provider-side prompt caching can match
+# the shared prefix across calls.
+_ASK_QUESTION_PREFIX = dedent(
+    """
+    If necessary, ask one essential question for continued implementation.
+    If no question is necessary, respond 'No Question'.
+
+    **Example:**
+        Context:
+        1. Imported the Flask module from the flask package
+        Current Component: Create a Flask application instance
+        Clarification: None
+
+        No Question
+
+
+    **Example:**
+        Context:
+        1. The code imported the Flask module from the flask package
+        2. The code created a Flask application named "app"
+        3. Created a route for the root URL ('/')
+        Current Component: Create a function that will be called when the root URL is accessed.\
+                This function should return HTML with a temporary Title, Author, and Body Paragraph
+
+        What should the function be called?
+
+    *Context:*
+    """
+)
+
+_IMPLEMENT_COMPONENT_PREFIX = """
+Provide complete and accurate code for the current component only. Your code for the current component will be used to implement the initial prompt.\
+Use placeholders referencing code/functions already provided in the context. Never provide unspecified code.
+*Context:*
+"""  # noqa E501
+
+_IMPLEMENT_COMPONENTS_PREFIX = """\
+Provide complete and accurate code for each of the components listed below, in the order given. Your code will be used to implement the initial prompt.\
+Use placeholders referencing code/functions already provided in the context. Never provide unspecified code.
+Return one file per component.
+
+"""  # noqa E501
+
+_PLAN_COMPONENTS_PREFIX, _PLAN_COMPONENTS_SUFFIX = """\
+List the essential code components required to implement the project idea. Each component should be atomic, \
+such that a developer could implement it in isolation provided placeholders for preceding components.
+
+Your responses must:
+1. Include specific components
+2. Be comprehensive, accurate, and complete
+3. Use technical terms appropriate for the specific programming language and framework
+4. Sequence components logically, with later components dependent on previous ones
+5. Not include implementation details or code snippets
+6. Assume all dependencies are already installed but NOT imported
+7. Be decisive and clear, avoiding ambiguity or vagueness
+8. Be declarative, using action verbs to describe the component.
+
+Project Idea:
+{starting_prompt}
+        """.split(
+    "{starting_prompt}"
+)
+
+_GENERATE_SUMMARY_PREFIX = """Summarize what has been implemented in the current component. Append it to the list of previously summarized components.
+
+For its summary:
+1. Include file name, function name, and variable names.
+2. Objectively summarize the component's purpose and functionality.
+3. Be concise and clear.
+
+Example Output:
+["1. Imported numpy as np from the numpy package in the file 'main.py'",
+"2. Created a function named 'calculate_mean' that calculates the mean of a np.array in the file 'util.py'",
+"3. Imported the 'calculate_mean' function in the file 'main.py'",
+"3. Instantiated a variable 'foo' as an np.array in the file 'main.py'",
+"4. Used calculate_mean to calculate the mean of 'foo' in the file 'main.py'"]
+
+"""  # noqa E501
+
+_IMPLEMENT_HTML_PREFIX = """\
+Generated html elements should be returned as a string with the following format.
+Remember to ONLY return the generated HTML element. Do not include any other information.
+
+Example 1.
+Generate an html element with the following description:
+A header that says `Title`
+
+<h1>Title</h1>
+
+Example 2.
+Generate an html element with the following description:
+An input form with a submit button
+
+<form method="POST" action="/">
+<label for="textInput">Input:</label>
+<input type="text" id="textInput" name="textInput" required>
+<button type="submit">Submit</button>
+</form>
+
+Example 3.
+Generate an html element with the following description:
+Create a paragraph with the text `Hello, World!`
+
+<p>Hello, World!</p>
+
+Generate an html element with the following description:
+"""
+
 
 class Operator(AbstractOperator):
     instructions = (
@@ -37,44 +147,27 @@ class Developer(Operator):
 
         Can return `no question`.
         """
-        return dedent(
-            f"""
-            *Context:*
-            {context}
-
-            If necessary, ask one essential question for continued implementation.
-            If no question is necessary, respond 'No Question'.
-
-            **Example:**
-                Context:
-                1. Imported the Flask module from the flask package
-                Current Component: Create a Flask application instance
-                Clarification: None
-
-                No Question
-
-
-            **Example:**
-                Context:
-                1. The code imported the Flask module from the flask package
-                2. The code created a Flask application named "app"
-                3. Created a route for the root URL ('/')
-                Current Component: Create a function that will be called when the root URL is accessed.\
-                This function should return HTML with a temporary Title, Author, and Body Paragraph
-
-                What should the function be called?"""
-        )
+        return _ASK_QUESTION_PREFIX + context
 
     def implement_component(self, context: str, options: dict[str, Any] = {}) -> str:
         """
         Prompts the Operator to implement a component based off of the components context.
         Returns the code for the component
         """
-        return f"""
-Provide complete and accurate code for the current component only. Your code for the current component will be used to implement the initial prompt.\
-Use placeholders referencing code/functions already provided in the context. Never provide unspecified code.
-*Context:*
-{context}"""  # noqa E501
+        return _IMPLEMENT_COMPONENT_PREFIX + context
+
+    def implement_components(self, contexts: list[str], options: dict[str, Any] = {}) -> str:
+        """
+        Prompts the Operator to implement several components in one request.
+
+        Batching amortizes the round-trip and the shared instruction prefix
+        across components; pass options={"response_format": ProjectDirectory}
+        so each component comes back as a file in one structured response.
+        """
+        numbered = "\n\n".join(
+            f"Component {index}:\n{context}" for index, context in enumerate(contexts, start=1)
+        )
+        return _IMPLEMENT_COMPONENTS_PREFIX + numbered
 
     def integrate_components(
         self,
@@ -87,53 +180,23 @@ Use placeholders referencing code/functions already provided in the context. Nev
         Prompts Operator to combine code implementations of multiple components
         Returns the combined code
         """
-        prev_components = []
-        for desc, code in zip(planned_components, implementations):
-            prev_components.append(
-                f"\nComponent description: {desc}\nImplementation\nFile: {code.file_name}\nFile Contents:\n{code.file_contents}\n"  # noqa E501
-            )
+        prev_components = "".join(
+            f"\nComponent description: {desc}\nImplementation\nFile: {code.file_name}\nFile Contents:\n{code.file_contents}\n"  # noqa E501
+            for desc, code in zip(planned_components, implementations)
+        )
 
         out_str = f"""\
 Task: Use ALL of the provided components to implement the original idea. Include every provided file.
-Idea: {idea}
 
 First, think about all files you intend to use in the final output. Then, combine the code from each component into those files.
+Idea: {idea}
 **Components:**
-    {"".join(prev_components)}
+    {prev_components}
             """  # noqa E501
         return out_str
 
     def implement_html_element(self, prompt: str, options: dict[str, Any] = {}) -> str:
-        out_str = f"""\
-Generate an html element with the following description:\n
-{prompt}
-
-Generated html elements should be returned as a string with the following format.
-Remember to ONLY return the generated HTML element. Do not include any other information.
-
-Example 1.
-Generate an html element with the following description:
-A header that says `Title`
-
-<h1>Title</h1>
-
-Example 2.
-Generate an html element with the following description:
-An input form with a submit button
-
-<form method="POST" action="/">
-<label for="textInput">Input:</label>
-<input type="text" id="textInput" name="textInput" required>
-<button type="submit">Submit</button>
-</form>
-
-Example 3.
-Generate an html element with the following description:
-Create a paragraph with the text `Hello, World!`
-
-<p>Hello, World!</p>
-"""
-        return out_str
+        return _IMPLEMENT_HTML_PREFIX + prompt
 
 
 class Executive(Operator):
@@ -160,25 +223,7 @@ class Executive(Operator):
     """
 
     def plan_components(self, starting_prompt, options: dict[str, Any] = {}) -> str:
-        return """\
-List the essential code components required to implement the project idea. Each component should be atomic, \
-such that a developer could implement it in isolation provided placeholders for preceding components.
-
-Your responses must:
-1. Include specific components
-2. Be comprehensive, accurate, and complete
-3. Use technical terms appropriate for the specific programming language and framework
-4. Sequence components logically, with later components dependent on previous ones
-5. Not include implementation details or code snippets
-6. Assume all dependencies are already installed but NOT imported
-7. Be decisive and clear, avoiding ambiguity or vagueness
-8. Be declarative, using action verbs to describe the component.
-
-Project Idea:
-{starting_prompt}
-        """.format(
-            starting_prompt=starting_prompt
-        )
+        return f"{_PLAN_COMPONENTS_PREFIX}{starting_prompt}{_PLAN_COMPONENTS_SUFFIX}"
 
     def answer_question(self, context: str, question: str, options: dict[str, Any] = {}) -> str:
         """
@@ -186,9 +231,9 @@ Project Idea:
         Returns the answer
         """
         return (
-            f"Context: {context} Developer's Question: {question}\n"
             "As the senior advisor, answer with specificity the developer's question about this component."
-            "If there is no question, then respond with 'Okay'. Do not provide clarification unprompted."
+            "If there is no question, then respond with 'Okay'. Do not provide clarification unprompted.\n"
+            f"Context: {context} Developer's Question: {question}"
         )
 
     def generate_summary(self, summary: str, implementation: str, options: dict[str, Any] = {}) -> str:
@@ -196,23 +241,7 @@ Project Idea:
         Generates a summary of completed components
         Returns the summary
         """
-        prompt = f"""Summarize what has been implemented in the current component. Append it to the list of previously summarized components.
-
-For its summary:
-1. Include file name, function name, and variable names.
-2. Objectively summarize the component's purpose and functionality.
-3. Be concise and clear.
-
-Example Output:
-["1. Imported numpy as np from the numpy package in the file 'main.py'",
-"2. Created a function named 'calculate_mean' that calculates the mean of a np.array in the file 'util.py'",
-"3. Imported the 'calculate_mean' function in the file 'main.py'",
-"3. Instantiated a variable 'foo' as an np.array in the file 'main.py'",
-"4. Used calculate_mean to calculate the mean of 'foo' in the file 'main.py'"]
-
-Current Component Implementation: {implementation}
-Previous Components: {summary}"""  # noqa E501
-        return prompt
+        return f"{_GENERATE_SUMMARY_PREFIX}Current Component Implementation: {implementation}\nPrevious Components: {summary}"  # noqa E501
 
     def update_parent_summary(
         self,
@@ -226,13 +255,7 @@ Previous Components: {summary}"""  # noqa E501
         Updates the parent summary with the child summary
         Returns the updated parent summary
         """
-        return f"""Given the following parent summary structure:
-Existing Parent Overall Summary: <{parent_summary}>
-Existing Parent Child Summaries: <{parent_child_summaries}>
-
-Your task is to update the existing summary with this new child summary:
-Child Name: <{child_name}>
-Child Summary: <{child_summary}>
+        return f"""Your task is to update an existing parent summary structure with a new child summary.
 
 Follow these steps:
 1. If the parent summary is empty, initialize it with the child summary.
@@ -255,19 +278,28 @@ Child Summaries:
 Guidelines:
 - Ensure the Overall Summary provides a high-level overview of all children while preserving important implementation details.
 - Each child summary should accurately represent its corresponding node.
+
+Given the following parent summary structure:
+Existing Parent Overall Summary: <{parent_summary}>
+Existing Parent Child Summaries: <{parent_child_summaries}>
+
+Update the existing summary with this new child summary:
+Child Name: <{child_name}>
+Child Summary: <{child_summary}>
 """  # noqa
 
     def summarize_file(self, contents: str, file_name: str, options: dict[str, Any] = {}) -> str:
-        return f"""Provide a concise summary of the following file, focusing on its purpose and the key functionalities of its contents. 
+        return f"""Provide a concise summary of the following file, focusing on its purpose and the key functionalities of its contents.
 The summary should give a high-level overview that explains what the file is for and its primary components or actions. Keep critical implementation details in mind.
 Return the summary in one paragraph.
-Below are the file's name and contents:
-Name: {file_name}
-Contents: {contents}
 
 Format your response as:
 node_name: <Name>
 summary: <summary of file contents>
+
+Below are the file's name and contents:
+Name: {file_name}
+Contents: {contents}
 """  # noqa
 
     def summarize_from_children(
@@ -1,9 +1,8 @@
 from collections.abc import AsyncGenerator
 from typing import cast
-from uuid import UUID, uuid1, uuid4
+from uuid import UUID, uuid4
 
 from concrete import prompts
-from concrete.clients.openai import OpenAIClient
 from concrete.operators import Developer, Executive, Operator
 from concrete.projects import SoftwareProject
 from concrete.state import ProjectStatus, State, StatefulMixin
@@ -18,8 +17,12 @@ class SoftwareOrchestrator(Orchestrator, StatefulMixin):
     """
 
     def __init__(self, store_messages: bool = False):
+        # Imported here so `import concrete` doesn't pay for the openai SDK;
+        # see the matching deferral in AbstractOperator.__init__.
+        from concrete.clients.openai import OpenAIClient
+
         self.state = State(self, orchestrator=self)
-        self.uuid = uuid1()
+        self.uuid = uuid4()
         self.clients = {
             "openai": OpenAIClient(),
         }
@@ -1,7 +1,6 @@
 import json
 from collections.abc import AsyncGenerator
-from textwrap import dedent
-from uuid import uuid1
+from uuid import uuid4
 
 from concrete.clients import LMClient_con
 from concrete.models.messages import (
@@ -35,7 +34,9 @@ class SoftwareProject(StatefulMixin):
         run_async: bool,
     ):
         self.state = State(self, orchestrator=orchestrator)
-        self.uuid = uuid1()  # suffix is unique based on network id
+        # uuid4 draws random bytes; uuid1 reads the clock and node id under a
+        # global lock, and nothing here relies on the embedded timestamp.
+        self.uuid = uuid4()
         self.clients = clients
         self.starting_prompt = starting_prompt
         self.exec = exec
@@ -61,7 +62,7 @@ class SoftwareProject(StatefulMixin):
         )  # type: ignore
         if self.run_async:
             planned_components_resp = planned_components_resp.get().message
-        components: list[str] = planned_components_resp.components
+        components: tuple[str, ...] = planned_components_resp.components
         yield Executive.__name__, str(planned_components_resp)
 
         summary = ""
@@ -139,10 +140,10 @@ async def communicative_dehallucination(
             - summary (str): A concise summary of what has been achieved.
     """
 
-    context = dedent(
-        f"""Previous Components summarized:\n{summary}
-    Current Component: {component}"""
-    )
+    # No dedent: the first line is flush left, so there is no common indent to
+    # strip and the old per-call dedent() only rescanned the string. The four
+    # spaces before "Current Component" are part of the prompt as shipped.
+    context = f"Previous Components summarized:\n{summary}\n    Current Component: {component}"
     if starting_prompt:
         context = f"Starting Prompt:\n{starting_prompt}\n{context}"
 
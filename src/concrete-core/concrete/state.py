@@ -1,13 +1,21 @@
 from datetime import datetime, timezone
-from enum import StrEnum
+from enum import IntEnum
 
 
-class ProjectStatus(StrEnum):
-    INIT = "init"
-    READY = "ready"
-    WORKING = "working"
-    WAITING = "waiting"
-    FINISHED = "finished"
+class ProjectStatus(IntEnum):
+    """
+    Stored as a small integer; use `.label` for the display string.
+    """
+
+    INIT = 0
+    READY = 1
+    WORKING = 2
+    WAITING = 3
+    FINISHED = 4
+
+    @property
+    def label(self) -> str:
+        return self.name.lower()
 
 
 class State:
@@ -117,13 +117,8 @@ class KnowledgeGraphTool(metaclass=MetaTool):
             pass
             # Can possibly create child nodes for functions/classes in the file
 
-        res = []
-        for child in children:
-            with Session() as db:
-                child_node = crud.create_repo_node(db=db, repo_node_create=child)
-            res.append(child_node.id)
-
-        return res
+        with Session() as db:
+            return crud.create_repo_nodes(db=db, repo_node_creates=children)
 
     @classmethod
     def _should_ignore(cls, name: str, ignore_patterns: str) -> bool:
@@ -153,22 +148,19 @@ class KnowledgeGraphTool(metaclass=MetaTool):
         import matplotlib.pyplot as plt
         import networkx as nx
 
-        G = nx.DiGraph()
-        nodes: Queue[UUID] = Queue()
-        nodes.put(root_node_id)
-
-        while not nodes.empty():
-            node_id = nodes.get()
-            with Session() as db:
-                node = crud.get_repo_node(db=db, repo_node_id=node_id)
-                if node is None:
-                    continue
-                parent, children = node, node.children
+        # One CTE query for the whole subtree instead of a session + lookup
+        # per node; children come preloaded.
+        with Session() as db:
+            subtree = crud.get_repo_node_subtree(db=db, root_id=root_node_id)
+        if not subtree:
+            return
+        root_node = next(node for node in subtree if node.id == root_node_id)
 
-            for child in children:
+        G = nx.DiGraph()
+        for node in subtree:
+            for child in node.children:
                 G.add_node(child.abs_path)
-                G.add_edge(parent.abs_path, child.abs_path)
-                nodes.put(child.id)
+                G.add_edge(node.abs_path, child.abs_path)
 
         def _hierarchy_pos(G, root, levels=None, width=1.0, height=1.0):
             # https://stackoverflow.com/questions/29586520/can-one-get-hierarchical-graphs-from-networkx-with-python-3/29597209#29597209
@@ -215,11 +207,6 @@ class KnowledgeGraphTool(metaclass=MetaTool):
             vert_gap = height / (max([level for level in levels]) + 1)
             return make_pos({})
 
-        with Session() as db:
-            root_node = crud.get_repo_node(db=db, repo_node_id=root_node_id)
-            if not root_node:
-                db.close()
-                return
         graph_root_node = root_node.abs_path
         pos = _hierarchy_pos(G, root=graph_root_node)
 
@@ -244,26 +231,24 @@ class KnowledgeGraphTool(metaclass=MetaTool):
         Creates or overwrites all summaries in the knowledge graph.
         Prerequisite on the graph being built.
         """
-        node_ids: list[list[UUID]] = [[root_node_id]]  # Stack of node ids in ascending order of depth. root -> leaf
+        # Fetch the whole graph with one CTE query up front; the old walk
+        # re-fetched every node twice (once to find children, once to
+        # dispatch on partition_type).
         with Session() as db:
-            while node_ids[-1] != []:
-                to_append = []
-                for node_id in node_ids[-1]:
-                    node = crud.get_repo_node(db=db, repo_node_id=node_id)
-                    if node is not None:
-                        children = node.children
-                        children_ids = [child.id for child in children]
-                        to_append.extend(children_ids)
-                node_ids.append(to_append)
-
-            while node_ids:
-                for node_id in node_ids.pop():
-                    node = crud.get_repo_node(db=db, repo_node_id=node_id)
-                    if node is not None:
-                        if node.partition_type == "directory":
-                            KnowledgeGraphTool._upsert_parent_summary_from_children(node_id)
-                        elif node.partition_type == "file":
-                            KnowledgeGraphTool._upsert_leaf_summary(node_id)
+            subtree = crud.get_repo_node_subtree(db=db, root_id=root_node_id)
+        partition_types = {node.id: node.partition_type for node in subtree}
+        children_by_parent = {node.id: [child.id for child in node.children] for node in subtree}
+
+        node_ids: list[list[UUID]] = [[root_node_id]]  # Stack of node ids in ascending order of depth. root -> leaf
+        while node_ids[-1] != []:
+            node_ids.append([child_id for node_id in node_ids[-1] for child_id in children_by_parent.get(node_id, [])])
+
+        while node_ids:
+            for node_id in node_ids.pop():
+                if partition_types.get(node_id) == "directory":
+                    KnowledgeGraphTool._upsert_parent_summary_from_children(node_id)
+                elif partition_types.get(node_id) == "file":
+                    KnowledgeGraphTool._upsert_leaf_summary(node_id)
 
     @classmethod
     def _upsert_parent_summaries_to_root(cls, child_id: UUID) -> None:
@@ -375,14 +360,10 @@ class KnowledgeGraphTool(metaclass=MetaTool):
             if parent is None:
                 raise ValueError(f"Node {repo_node_id} not found.")
 
-            children = parent.children
-            children_ids = [child.id for child in children]
-            children_summaries: list[str] = []
+            # parent.children is already loaded; no need to re-fetch each
+            # child by id.
+            children_summaries: list[str] = [f"{child.abs_path}: {child.summary}" for child in parent.children]
             parent_name = parent.abs_path
-            for child_id in children_ids:
-                child = crud.get_repo_node(db=db, repo_node_id=child_id)
-                if child is not None:
-                    children_summaries.append(f"{child.abs_path}: {child.summary}")
 
         exec = Executive({"openai": OpenAIClient()})
         node_summary = exec.summarize_from_children(
@@ -10,6 +10,20 @@ from .orm import Session
 from .orm.models import MessageCreate
 
 
+def _store_answer(operator: AbstractOperator, response_format: type[Message], answer: Message) -> None:
+    with Session() as session:
+        create_message(
+            session,
+            MessageCreate(
+                type=response_format.__name__,
+                content=answer.model_dump(),
+                prompt=operator.starting_prompt,
+                project_id=operator.project_id,
+                operator_id=operator.operator_id,
+            ),
+        )
+
+
 def _qnawrapper(_qna: Callable) -> Callable:
     @wraps(_qna)
     def decorator(
@@ -17,25 +31,38 @@ def _qnawrapper(_qna: Callable) -> Callable:
         query: str,
         response_format: type[Message],
         instructions: str | None = None,
+        **kwargs,
+    ) -> Message:
+        # **kwargs keeps this transparent to _qna's routing options
+        # (model/max_tokens) and anything added later.
+        answer = _qna(self, query, response_format, instructions, **kwargs)
+        if self.store_messages:
+            _store_answer(self, response_format, answer)
+        return answer
+
+    return decorator
+
+
+def _aqnawrapper(_aqna: Callable) -> Callable:
+    # Async twin of _qnawrapper: without it, awaited calls (qna_batch, async
+    # producers) would silently skip message persistence.
+    @wraps(_aqna)
+    async def decorator(
+        self: AbstractOperator,
+        query: str,
+        response_format: type[Message],
+        instructions: str | None = None,
+        **kwargs,
     ) -> Message:
-        answer = _qna(self, query, response_format, instructions)
+        answer = await _aqna(self, query, response_format, instructions, **kwargs)
         if self.store_messages:
-            with Session() as session:
-                create_message(
-                    session,
-                    MessageCreate(
-                        type=response_format.__name__,
-                        content=repr(answer),
-                        prompt=self.starting_prompt,
-                        project_id=self.project_id,
-                        operator_id=self.operator_id,
-                    ),
-                )
+            _store_answer(self, response_format, answer)
         return answer
 
     return decorator
 
 
 AbstractOperator._qna = _qnawrapper(AbstractOperator._qna)  # type: ignore[assignment]
+AbstractOperator._aqna = _aqnawrapper(AbstractOperator._aqna)  # type: ignore[assignment]
 
 CLIClient.emit("concrete-db initialized")
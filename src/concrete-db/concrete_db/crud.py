@@ -1,7 +1,9 @@
 from collections.abc import Sequence
 from typing import TypeVar
-from uuid import UUID
+from uuid import UUID, uuid4
 
+from sqlalchemy import insert
+from sqlalchemy.orm import selectinload
 from sqlmodel import Session, select
 
 from .orm.models import (
@@ -297,6 +299,19 @@ def create_message(db: Session, message_create: MessageCreate) -> Message:
     )
 
 
+def create_messages(db: Session, message_creates: Sequence[MessageCreate]) -> list[UUID]:
+    """
+    Inserts many messages with a single executemany insert, skipping per-row
+    ORM bookkeeping. Returns the new message ids.
+    """
+    if not message_creates:
+        return []
+    rows = [{"id": uuid4(), **message_create.model_dump()} for message_create in message_creates]
+    db.execute(insert(Message), rows)
+    db.commit()
+    return [row["id"] for row in rows]
+
+
 def get_message(db: Session, message_id: UUID) -> Message | None:
     stmt = select(Message).where(Message.id == message_id)
     return db.scalars(stmt).first()
@@ -468,10 +483,39 @@ def create_node(db: Session, node_create: NodeCreate) -> Node:
     return create_generic(db, Node(**node_create.model_dump()))
 
 
+def get_node_subtree(db: Session, root_id: UUID) -> Sequence[Node]:
+    """
+    Returns the root node and all of its descendants in a single query.
+
+    Walking `.children` recursively issues one lazy load per node; a recursive
+    CTE fetches the whole subtree at once, and selectinload populates each
+    node's children from one extra batched query.
+    """
+    subtree = select(Node.id).where(Node.id == root_id).cte("subtree", recursive=True)  # type: ignore
+    subtree = subtree.union_all(select(Node.id).where(Node.parent_id == subtree.c.id))  # type: ignore
+    stmt = select(Node).where(Node.id.in_(select(subtree.c.id))).options(selectinload(Node.children))  # type: ignore
+    return db.scalars(stmt).all()
+
+
 def create_repo_node(db: Session, repo_node_create: RepoNodeCreate) -> RepoNode:
     return create_generic(db, RepoNode(**repo_node_create.model_dump()))
 
 
+def create_repo_nodes(db: Session, repo_node_creates: Sequence[RepoNodeCreate]) -> list[UUID]:
+    """
+    Inserts many repo nodes with a single executemany insert.
+
+    Repo ingestion creates thousands of nodes; per-row ORM inserts pay
+    unit-of-work bookkeeping and a round trip each. Returns the new node ids.
+    """
+    if not repo_node_creates:
+        return []
+    rows = [{"id": uuid4(), **repo_node_create.model_dump()} for repo_node_create in repo_node_creates]
+    db.execute(insert(RepoNode), rows)
+    db.commit()
+    return [row["id"] for row in rows]
+
+
 def get_repo_node(db: Session, repo_node_id: UUID) -> RepoNode | None:
     stmt = select(RepoNode).where(RepoNode.id == repo_node_id)
     return db.scalars(stmt).first()
@@ -495,6 +539,19 @@ def get_repo_node_by_path(db: Session, org: str, repo: str, abs_path: str, branc
     return db.scalars(stmt).first()
 
 
+def get_repo_node_subtree(db: Session, root_id: UUID) -> Sequence[RepoNode]:
+    """
+    Returns the repo node and all of its descendants in a single query.
+
+    See get_node_subtree; this is the RepoNode equivalent for loading a whole
+    repo tree without one lazy load per node.
+    """
+    subtree = select(RepoNode.id).where(RepoNode.id == root_id).cte("repo_subtree", recursive=True)  # type: ignore
+    subtree = subtree.union_all(select(RepoNode.id).where(RepoNode.parent_id == subtree.c.id))  # type: ignore
+    stmt = select(RepoNode).where(RepoNode.id.in_(select(subtree.c.id))).options(selectinload(RepoNode.children))  # type: ignore  # noqa: E501
+    return db.scalars(stmt).all()
+
+
 # ===User Auth=== #
 def create_authstate(db: Session, authstate_create: AuthStateCreate) -> AuthState:
     return create_generic(
@@ -1,3 +1,3 @@
-from .setup import Session
+from .setup import AsyncSession, Session
 
-__all__ = ["Session"]
+__all__ = ["AsyncSession", "Session"]
@@ -1,10 +1,9 @@
-import json
 from datetime import datetime
-from typing import Any, Mapping, Optional, Self, cast
+from typing import Any, Mapping, Optional, cast
 from uuid import UUID, uuid4
 
-from pydantic import ConfigDict, ValidationError, model_validator
-from sqlalchemy import CheckConstraint, DateTime, UniqueConstraint
+from pydantic import ConfigDict
+from sqlalchemy import JSON, CheckConstraint, DateTime, SmallInteger, UniqueConstraint
 from sqlalchemy.schema import Index
 from sqlalchemy.sql import func
 from sqlmodel import Field, Relationship, SQLModel
@@ -21,6 +20,12 @@ from .setup import SQLALCHEMY_DATABASE_URL, engine
 
 class Base(SQLModel):
     def __repr__(self) -> str:
+        # Cheap repr; logging and debuggers call this implicitly, so avoid
+        # serializing potentially large models (e.g. Message.content) to JSON.
+        return f"{type(self).__name__}(id={getattr(self, 'id', None)!r})"
+
+    def __str__(self) -> str:
+        # Full dump for interactive use only.
         return self.model_dump_json(indent=4, exclude_unset=True, exclude_none=True)
 
 
@@ -355,13 +360,16 @@ class Tool(ToolBase, MetadataMixin, table=True):
 
 
 class MessageBase(Base):
-    type: str = Field(description="type of message")
-    content: str = Field(description="Content of message as JSON dump")
+    type: str = Field(description="type of message", max_length=32)
+    content: str | dict = Field(
+        description="Content of message, as a dict of the message payload or plain text.",
+        sa_type=cast(Any, JSON),
+    )
     prompt: str | None = Field(
         description="Initial prompt for the thread this message belongs to.",
         default=None,
     )
-    status: ProjectStatus = ProjectStatus.INIT
+    status: ProjectStatus = Field(default=ProjectStatus.INIT, sa_type=cast(Any, SmallInteger))
 
     project_id: UUID = Field(
         description="ID of Project that owns this message.",
@@ -380,17 +388,15 @@ class MessageBase(Base):
         default=None,
     )
 
-    @model_validator(mode="after")
-    def check_operator_xor_user(self) -> Self:
-        if not (bool(self.operator_id) is not bool(self.user_id)):
-            raise ValidationError("The sender can only be one entity!")
-        return self
-
+    # Sender exclusivity is enforced by the CHECK constraint below; a pydantic
+    # model_validator here would re-run the same check on every validation.
     __table_args__ = (
         CheckConstraint(
             "(operator_id IS NULL) <> (user_id IS NULL)",
             name="The sender can only be one entity!",
         ),
+        # Covers "messages with status X, newest first" lookups.
+        Index("ix_message_status_created_at", "status", "created_at"),
     )
 
 
@@ -410,10 +416,12 @@ class Message(MessageBase, MetadataMixin, table=True):
     def to_obj(self):
         from concrete.models.messages import MESSAGE_REGISTRY
 
-        message_type = self.type
-        message_content = self.content
-
-        return MESSAGE_REGISTRY[message_type.lower()].model_validate(json.loads(message_content))
+        message_type = MESSAGE_REGISTRY[self.type.lower()]
+        # JSON columns hand back a dict, which validates without any parsing;
+        # legacy text content goes through one pydantic-core parse+validate pass.
+        if isinstance(self.content, str):
+            return message_type.model_validate_json(self.content)
+        return message_type.model_validate(self.content)
 
 
 # endregion
@@ -1,26 +1,37 @@
 import os
-from contextlib import contextmanager
+from contextlib import asynccontextmanager, contextmanager
+from functools import lru_cache
 
 from dotenv import load_dotenv
-from sqlalchemy import URL
+from sqlalchemy import URL, Engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 from sqlmodel import Session as SQLModelSession
 from sqlmodel import create_engine
 
 from concrete.clients import CLIClient
 
-load_dotenv(override=True)
-if (
-    (drivername := os.environ.get("DB_DRIVER")) is None
-    or (username := os.environ.get("DB_USERNAME")) is None
-    or (password := os.environ.get("DB_PASSWORD")) is None
-    or (host := os.environ.get("DB_HOST")) is None
-    or (db_port := int(os.environ.get("DB_PORT") or "0")) == 0
-    or (database := os.environ.get("DB_DATABASE")) is None
-):
-    CLIClient.emit("Missing environment variables for database connection. Defaulting to SQLite.")
-    SQLALCHEMY_DATABASE_URL = URL.create(drivername="sqlite", database="sql_app.db")
-else:
-    SQLALCHEMY_DATABASE_URL = URL.create(
+
+@lru_cache(maxsize=1)
+def _database_url() -> URL:
+    """
+    Reads the environment and builds the database URL exactly once per process,
+    deferred to first engine use so import stays cheap for workers that never
+    touch the database.
+    """
+    load_dotenv(override=True)
+    if (
+        (drivername := os.environ.get("DB_DRIVER")) is None
+        or (username := os.environ.get("DB_USERNAME")) is None
+        or (password := os.environ.get("DB_PASSWORD")) is None
+        or (host := os.environ.get("DB_HOST")) is None
+        or (db_port := int(os.environ.get("DB_PORT") or "0")) == 0
+        or (database := os.environ.get("DB_DATABASE")) is None
+    ):
+        CLIClient.emit("Missing environment variables for database connection. Defaulting to SQLite.")
+        return URL.create(drivername="sqlite", database="sql_app.db")
+
+    url = URL.create(
         drivername=drivername,
         username=username,
         password=password,
@@ -28,21 +39,135 @@ else:
         port=db_port,
         database=database,
     )
-    CLIClient.emit(f"Database environment variables found. ORM URL configured as: {SQLALCHEMY_DATABASE_URL}")
+    CLIClient.emit(
+        "Database environment variables found. " f"ORM URL configured as: {url.render_as_string(hide_password=True)}"
+    )
+    return url
+
+
+@lru_cache(maxsize=1)
+def _pool_kwargs() -> dict:
+    return {
+        "pool_size": int(os.environ.get("DB_POOL_SIZE", "20")),
+        "max_overflow": int(os.environ.get("DB_MAX_OVERFLOW", "40")),
+        "pool_timeout": int(os.environ.get("DB_POOL_TIMEOUT", "5")),
+        # Validate pooled connections cheaply on checkout and recycle them
+        # before typical server idle timeouts, so dropped connections don't
+        # surface as mid-request errors.
+        "pool_pre_ping": True,
+        "pool_recycle": int(os.environ.get("DB_POOL_RECYCLE", "1800")),
+    }
+
+
+@lru_cache(maxsize=1)
+def _init_engine() -> Engine:
+    url = _database_url()
+    if url.drivername == "sqlite":
+        # Never delete the database implicitly on import; an explicit opt-in
+        # reset keeps the schema, page cache, and compiled statement cache
+        # warm across process restarts.
+        if os.environ.get("CONCRETE_RESET_DB") == "1" and url.database is not None:
+            if os.path.exists(url.database):
+                CLIClient.emit("CONCRETE_RESET_DB=1; removing existing sqlite database.")
+                os.remove(url.database)
+
+        # A single shared connection avoids cross-thread locking issues with sqlite.
+        engine = create_engine(
+            url,
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+
+        @event.listens_for(engine, "connect")
+        def _set_sqlite_pragma(dbapi_connection, connection_record):
+            # WAL lets readers run concurrently with a writer, and NORMAL
+            # drops the per-commit fsync that dominates message logging;
+            # mmap'd reads skip per-page read() syscalls.
+            cursor = dbapi_connection.cursor()
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.execute("PRAGMA temp_store=MEMORY")
+            cursor.execute("PRAGMA mmap_size=268435456")
+            cursor.close()
+
+        return engine
+
+    # Size the pool explicitly so concurrent FastAPI/Celery workers don't
+    # saturate the default (5 + 10) pool and pay a fresh connection handshake
+    # per request.
+    if url.drivername.startswith("postgresql"):
+        # TCP keepalives stop NATs/load balancers from silently dropping idle
+        # pooled connections.
+        connect_args = {"keepalives": 1, "keepalives_idle": 30, "keepalives_interval": 10}
+    else:
+        connect_args = {}
+    return create_engine(url, connect_args=connect_args, **_pool_kwargs())
 
 
-if SQLALCHEMY_DATABASE_URL.drivername == "sqlite":
-    connect_args = {"check_same_thread": False}
-else:
-    connect_args = {}
+@lru_cache(maxsize=1)
+def _init_sessionmaker() -> sessionmaker:
+    # One factory per process; per-call SQLModelSession(engine) would redo
+    # engine binding/configuration work on every request.
+    return sessionmaker(class_=SQLModelSession, bind=_init_engine())
 
-engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args=connect_args)
+
+def __getattr__(name: str):
+    # Engine construction (and the dotenv read behind it) is deferred until
+    # something actually asks for it.
+    if name == "SQLALCHEMY_DATABASE_URL":
+        return _database_url()
+    if name == "engine":
+        return _init_engine()
+    if name == "SessionLocal":
+        return _init_sessionmaker()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 @contextmanager
 def Session():
-    session = SQLModelSession(engine)
+    session = _init_sessionmaker()()
     try:
         yield session
     finally:
         session.close()
+
+
+_AsyncSessionLocal = None
+
+
+def _get_async_sessionmaker():
+    """
+    Builds the async engine and session factory on first use, so the async
+    driver (aiosqlite/asyncpg) is only required when AsyncSession is used.
+    """
+    global _AsyncSessionLocal
+    if _AsyncSessionLocal is None:
+        from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+        url = _database_url()
+        if url.drivername == "sqlite":
+            async_engine = create_async_engine(
+                url.set(drivername="sqlite+aiosqlite"),
+                connect_args={"check_same_thread": False},
+                poolclass=StaticPool,
+            )
+        else:
+            async_engine = create_async_engine(
+                url.set(drivername="postgresql+asyncpg"),
+                **_pool_kwargs(),
+            )
+        _AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False)
+    return _AsyncSessionLocal
+
+
+@asynccontextmanager
+async def AsyncSession():
+    """
+    Async counterpart of Session for I/O-bound request handlers; queries can be
+    awaited instead of blocking a worker thread.
+    """
+    session = _get_async_sessionmaker()()
+    try:
+        yield session
+    finally:
+        await session.close()
@@ -0,0 +1,78 @@
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+import concrete_async
+from concrete.abstract import AbstractOperator
+from concrete.models.messages import PlannedComponents, ProjectDirectory, ProjectFile
+from concrete_async.models import Operation
+from kombu.serialization import dumps, loads
+
+
+class TestConcreteJsonSerializer(unittest.TestCase):
+    """
+    Test that the concrete-json serializer round-trips task payloads.
+    """
+
+    def test_message_round_trip(self):
+        directory = ProjectDirectory(
+            project_name="helloworld",
+            files=[ProjectFile(file_name="main.py", file_contents='print("Hello, World!")')],
+        )
+        components = PlannedComponents(components=("auth", "api"))
+
+        content_type, encoding, payload = dumps(
+            {"directory": directory, "components": components},
+            serializer="concrete-json",
+        )
+        self.assertEqual(content_type, "application/x-concrete-json")
+
+        decoded = loads(payload, content_type, encoding)
+        self.assertEqual(decoded["directory"], directory)
+        self.assertIsInstance(decoded["components"].components, tuple)
+        self.assertEqual(decoded["components"], components)
+
+    def test_operation_round_trip(self):
+        operation = Operation(
+            client_name="openai",
+            function_name="complete",
+            arg_dict={"messages": [{"role": "user", "content": "hi"}]},
+        )
+
+        content_type, encoding, payload = dumps(operation, serializer="concrete-json")
+        decoded = loads(payload, content_type, encoding)
+        self.assertEqual(decoded, operation)
+
+
+class BatchedOperator(AbstractOperator):
+    instructions = "Answer tersely."
+
+    def make_prompt(self, subject: str, options={}) -> str:
+        return f"prompt for {subject}"
+
+
+class TestDelayMany(unittest.TestCase):
+    """
+    Test that delay_many publishes every call over one acquired producer.
+    """
+
+    def test_single_producer_for_batch(self):
+        client = SimpleNamespace(model="gpt-4o-mini", default_temperature=0.0)
+        operator = BatchedOperator(clients={"openai": client})
+
+        with mock.patch.object(concrete_async, "abstract_operation") as task:
+            concrete_async.delay_many(
+                operator,
+                [("make_prompt", ("x",), {}), ("make_prompt", ("y",), {})],
+            )
+
+        task.app.producer_pool.acquire.assert_called_once_with(block=True)
+        producer = task.app.producer_pool.acquire.return_value.__enter__.return_value
+
+        self.assertEqual(task.apply_async.call_count, 2)
+        prompts = []
+        for call in task.apply_async.call_args_list:
+            self.assertIs(call.kwargs["producer"], producer)
+            operation = call.kwargs["kwargs"]["operation"]
+            prompts.append(operation.arg_dict["messages"][1]["content"])
+        self.assertEqual(prompts, ["prompt for x", "prompt for y"])
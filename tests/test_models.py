@@ -1,3 +1,4 @@
+import json
 import unittest
 from uuid import uuid4
 
@@ -5,8 +6,9 @@ from concrete_db.orm.models import Message as SQLModelMessage
 from concrete_db.orm.models import Operator as SQLModelOperator
 from concrete_db.orm.models import Project
 
-from concrete.models.messages import TextMessage
+from concrete.models.messages import PlannedComponents, ProjectDirectory, ProjectFile, TextMessage
 from concrete.operators import Developer, Executive
+from concrete.state import ProjectStatus
 
 
 class TestSQLModels(unittest.TestCase):
@@ -68,3 +70,55 @@ class TestSQLModels(unittest.TestCase):
             pydantic_operator_executive.instructions,
             sql_operator_executive.instructions,
         )
+
+
+class TestProjectStatus(unittest.TestCase):
+    """
+    Test the integer-backed ProjectStatus and its display labels.
+    """
+
+    def test_labels(self):
+        for status in ProjectStatus:
+            self.assertEqual(status.label, status.name.lower())
+
+    def test_message_status_defaults_to_init(self):
+        sql_message = SQLModelMessage(
+            type="textmessage",
+            content={"text": "hi"},
+            project_id=uuid4(),
+            operator_id=uuid4(),
+        )
+        self.assertEqual(sql_message.status, ProjectStatus.INIT)
+        # SmallInteger-backed: the stored value is the enum's int.
+        self.assertEqual(int(sql_message.status), 0)
+
+
+class TestFromTrusted(unittest.TestCase):
+    """
+    Test that Message.from_trusted rebuilds the same object full validation would.
+    """
+
+    def test_tuple_fields(self):
+        """
+        Tuple-annotated fields arrive as JSON lists and must come back as tuples.
+        """
+        components = PlannedComponents(components=("auth", "api", "frontend"))
+        data = json.loads(components.model_dump_json())
+
+        rebuilt = PlannedComponents.from_trusted(data)
+        self.assertIsInstance(rebuilt.components, tuple)
+        self.assertEqual(rebuilt, PlannedComponents.model_validate(data))
+
+    def test_nested_messages(self):
+        """
+        Nested Message and list[Message] fields are rebuilt recursively.
+        """
+        directory = ProjectDirectory(
+            project_name="helloworld",
+            files=[ProjectFile(file_name="main.py", file_contents='print("Hello, World!")')],
+        )
+        data = json.loads(directory.model_dump_json())
+
+        rebuilt = ProjectDirectory.from_trusted(data)
+        self.assertIsInstance(rebuilt.files[0], ProjectFile)
+        self.assertEqual(rebuilt, directory)
@@ -1,6 +1,16 @@
+import asyncio
 import unittest
+from types import SimpleNamespace
+
+from openai import RateLimitError
+
+try:
+    import httpx
+except ModuleNotFoundError:  # openai >= 3 vendors httpx as httpx2
+    import httpx2 as httpx
 
 from concrete.abstract import AbstractOperator
+from concrete.models.messages import TextMessage
 from concrete.operators import Operator
 
 
@@ -111,3 +121,116 @@ class TestOperator(unittest.TestCase):
                 wrapped_result,
                 f"Method '{method_name}' should not invoke _qna and return the original response",
             )
+
+
+class BatchOperator(AbstractOperator):
+    instructions = "Answer tersely."
+
+
+class TestQnaBatch(unittest.TestCase):
+    """
+    Verify qna_batch throttling: results stay in query order, rate limited
+    queries retry, and oversized token estimates cannot stall the batch.
+    """
+
+    def _operator(self) -> BatchOperator:
+        # token_count is only used for cost estimates; length is close enough.
+        fake_client = SimpleNamespace(token_count=lambda text: len(text))
+        return BatchOperator(clients={"openai": fake_client})
+
+    def test_results_in_query_order(self):
+        operator = self._operator()
+
+        async def mock_aqna(self, query, response_format, instructions=None):
+            # Delay the first query so completion order differs from
+            # submission order.
+            await asyncio.sleep(0.05 if query == "first" else 0)
+            return f"answered: {query}"
+
+        BatchOperator._aqna = mock_aqna
+
+        results = asyncio.run(operator.qna_batch(["first", "second", "third"]))
+        self.assertEqual(results, ["answered: first", "answered: second", "answered: third"])
+
+    def test_rate_limited_query_retries(self):
+        operator = self._operator()
+        attempts = []
+
+        async def mock_aqna(self, query, response_format, instructions=None):
+            attempts.append(query)
+            if len(attempts) == 1:
+                response = httpx.Response(429, request=httpx.Request("POST", "https://api.test"))
+                raise RateLimitError("rate limited", response=response, body=None)
+            return f"answered: {query}"
+
+        BatchOperator._aqna = mock_aqna
+
+        results = asyncio.run(operator.qna_batch(["only"]))
+        self.assertEqual(results, ["answered: only"])
+        self.assertEqual(len(attempts), 2)
+
+    def test_oversized_estimate_is_clamped(self):
+        """
+        A query estimated above max_tokens_per_minute must still run (after
+        waiting out the budget) rather than polling for capacity forever.
+        """
+        operator = self._operator()
+
+        async def mock_aqna(self, query, response_format, instructions=None):
+            return f"answered: {query}"
+
+        BatchOperator._aqna = mock_aqna
+
+        async def run():
+            return await asyncio.wait_for(
+                operator.qna_batch(["q" * 400], max_tokens_per_minute=100),
+                timeout=5,
+            )
+
+        self.assertEqual(asyncio.run(run()), ["answered: " + "q" * 400])
+
+
+class CacheOperator(AbstractOperator):
+    instructions = "Answer tersely."
+
+
+class TestResponseCache(unittest.TestCase):
+    """
+    Verify the exact and semantic response caches on _qna.
+    """
+
+    def _client(self, calls: list):
+        def complete(messages, message_format, **kwargs):
+            calls.append(messages[1]["content"])
+            parsed = TextMessage(text=f"answer {len(calls)}")
+            message = SimpleNamespace(refusal=None, parsed=parsed)
+            return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+        # A constant embedding makes every query pair semantically identical.
+        return SimpleNamespace(complete=complete, embed=lambda text: [1.0, 0.0])
+
+    def test_exact_cache(self):
+        calls: list = []
+        operator = CacheOperator(clients={"openai": self._client(calls)}, cache=True)
+
+        first = operator._qna("What is 2 + 2?", response_format=TextMessage)
+        second = operator._qna("What is 2 + 2?", response_format=TextMessage)
+        self.assertIs(first, second)
+        self.assertEqual(len(calls), 1)
+
+        # Routed calls must not share cache entries with default-routed ones.
+        operator._qna("What is 2 + 2?", response_format=TextMessage, model="gpt-4o")
+        self.assertEqual(len(calls), 2)
+
+    def test_semantic_cache(self):
+        calls: list = []
+        operator = CacheOperator(
+            clients={"openai": self._client(calls)},
+            cache=True,
+            semantic_cache_threshold=0.9,
+        )
+
+        first = operator._qna("What is two plus two?", response_format=TextMessage)
+        second = operator._qna("What's 2 + 2?", response_format=TextMessage)
+        self.assertIs(first, second)
+        self.assertEqual(len(calls), 1)